@@ -1,14 +1,16 @@
 """gpustat CLI."""
 
+import argparse
+import functools
 import os
+import signal
 import sys
 import time
 from contextlib import suppress
-
-from blessed import Terminal
+from io import StringIO
 
 from gpustat import __version__
-from gpustat.core import GPUStatCollection
+from gpustat.core import GPUStatCollection, _get_terminal
 
 
 SHTAB_PREAMBLE = {
@@ -54,14 +56,18 @@ def get_complete_for_one_or_zero(input):
     return output
 
 
-def print_gpustat(*, id=None, json=False, debug=False, **kwargs):
-    '''Display the GPU query results into standard output.'''
+def print_gpustat(*, id=None, json=False, debug=False, no_processes=False,
+                  fp=None, **kwargs):
+    '''Display the GPU query results into standard output (or fp).'''
+    if fp is None:
+        fp = sys.stdout
     try:
-        gpu_stats = GPUStatCollection.new_query(debug=debug, id=id)
+        gpu_stats = GPUStatCollection.new_query(debug=debug, id=id,
+                                                no_processes=no_processes)
     except Exception as e:
         sys.stderr.write('Error on querying NVIDIA devices. '
                          'Use --debug flag to see more details.\n')
-        term = Terminal(stream=sys.stderr)
+        term = _get_terminal(stream=sys.stderr)
         sys.stderr.write(term.red(str(e)) + '\n')
 
         if debug:
@@ -79,46 +85,64 @@ def print_gpustat(*, id=None, json=False, debug=False, **kwargs):
         sys.exit(1)
 
     if json:
-        gpu_stats.print_json(sys.stdout)
+        gpu_stats.print_json(fp)
     else:
-        gpu_stats.print_formatted(sys.stdout, **kwargs)
+        gpu_stats.print_formatted(fp, no_processes=no_processes, **kwargs)
 
 
 def loop_gpustat(interval=1.0, **kwargs):
-    term = Terminal()
+    term = _get_terminal()
 
+    # Frames are scheduled on absolute deadlines (using a monotonic clock),
+    # so that the time spent on querying and printing does not add up.
+    deadline = time.monotonic()
     with term.fullscreen():
         while 1:
             try:
-                query_start = time.time()
+                deadline += interval
+
+                # Render the whole frame first and write it out at once,
+                # so that the screen is updated with a single write.
+                frame = StringIO()
 
                 # Move cursor to (0, 0) but do not restore original cursor loc
-                print(term.move(0, 0), end='')
-                print_gpustat(eol_char=term.clear_eol + os.linesep, **kwargs)
-                print(term.clear_eos, end='')
-
-                query_duration = time.time() - query_start
-                sleep_duration = interval - query_duration
-                if sleep_duration > 0:
-                    time.sleep(sleep_duration)
+                frame.write(term.move(0, 0))
+                print_gpustat(fp=frame, eol_char=term.clear_eol + os.linesep,
+                              **kwargs)
+                frame.write(term.clear_eos)
+
+                sys.stdout.write(frame.getvalue())
+                sys.stdout.flush()
+
+                now = time.monotonic()
+                if deadline > now:
+                    time.sleep(deadline - now)
+                else:
+                    # fell behind (e.g. a slow query); don't try to catch up
+                    deadline = now
             except KeyboardInterrupt:
                 return 0
 
 
-def main(*argv):
-    """The main entrypoint to the gpustat CLI."""
-    if not argv:
-        argv = list(sys.argv)
+class ShowAllAction(argparse.Action):
+    """--show-all: turn on all the display options at once."""
 
-    # attach SIGPIPE handler to properly handle broken pipe
-    try:  # sigpipe not available under windows. just ignore in this case
-        import signal
-        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-    except Exception:  # pylint: disable=broad-exception-caught
-        pass
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(option_strings, dest, nargs=0,
+                         default=argparse.SUPPRESS, **kwargs)
 
-    # arguments to gpustat
-    import argparse
+    def __call__(self, parser, namespace, values, option_string=None):
+        namespace.show_cmd = True
+        namespace.show_user = True
+        namespace.show_pid = True
+        namespace.show_fan_speed = True
+        namespace.show_codec = 'enc,dec'
+        namespace.show_power = 'draw,limit'
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of gpustat (only once)."""
     try:
         import shtab
     except ImportError:
@@ -139,7 +163,7 @@ def main(*argv):
     parser_color.add_argument('--no-color', action='store_true',
                               help='Suppress colored output')
     parser.add_argument('--id', help='Target a specific GPU (index).')
-    parser.add_argument('-a', '--show-all', action='store_true',
+    parser.add_argument('-a', '--show-all', action=ShowAllAction,
                         help='Display all gpu properties above')
     parser.add_argument('-c', '--show-cmd', action='store_true',
                         help='Display cmd name of running process')
@@ -193,18 +217,26 @@ def main(*argv):
     )
     parser.add_argument('-v', '--version', action='version',
                         version=('gpustat %s' % __version__))
+    return parser
+
+
+def main(*argv):
+    """The main entrypoint to the gpustat CLI."""
+    if not argv:
+        argv = list(sys.argv)
+
+    # attach SIGPIPE handler to properly handle broken pipe
+    try:  # sigpipe not available under windows. just ignore in this case
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+
+    # arguments to gpustat
+    parser = _build_parser()
     args = parser.parse_args(argv[1:])
     # TypeError: GPUStatCollection.print_formatted() got an unexpected keyword argument 'print_completion'
     with suppress(AttributeError):
         del args.print_completion  # type: ignore
-    if args.show_all:
-        args.show_cmd = True
-        args.show_user = True
-        args.show_pid = True
-        args.show_fan_speed = True
-        args.show_codec = 'enc,dec'
-        args.show_power = 'draw,limit'
-    del args.show_all  # type: ignore
 
     if args.interval is None:  # with default value
         args.interval = 1.0
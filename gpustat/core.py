@@ -6,8 +6,9 @@ Implementation of gpustat
 """
 
 import functools
+import itertools
 from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, List,
-                    Optional, Sequence, Union, cast)
+                    Optional, Sequence, Set, Tuple, Union)
 
 try:
     from typing_extensions import TypedDict
@@ -22,7 +23,9 @@ import locale
 import os.path
 import platform
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import StringIO
 
@@ -39,8 +42,25 @@ MB = 1024 * 1024
 
 DEFAULT_GPUNAME_WIDTH = 16
 
+# The maximum number of threads to query GPUs in parallel
+MAX_QUERY_THREADS = 8
+
 IS_WINDOWS = 'windows' in platform.platform().lower()
 
+# The hostname does not change during the lifetime of the process
+_HOSTNAME = platform.node()
+
+
+@functools.lru_cache(maxsize=None)
+def _time_format() -> str:
+    """The strftime format for the query time in the header."""
+    if IS_WINDOWS:
+        # no localization is available; just use a reasonable default
+        # same as str(timestr) but without ms
+        return '%Y-%m-%d %H:%M:%S'
+    # Computed upon the first use (not import), after setlocale() if any.
+    return locale.nl_langinfo(locale.D_T_FMT)
+
 
 # Types
 NVMLHandle = Any  # N.c_nvmlDevice_t
@@ -68,8 +88,86 @@ NvidiaGPUInfo = TypedDict('NvidiaGPUInfo', {
 }, total=False) if TYPE_CHECKING else dict  # type: ignore
 
 
+# All the color names that can be used in GPUStat.print_to()
+_COLOR_NAMES = (
+    'C0', 'C1', 'CName', 'CTemp', 'FSpeed', 'CMemU', 'CMemT', 'CMemP',
+    'CCPUMemU', 'CUser', 'CUtil', 'CUtilEnc', 'CUtilDec', 'CCPUUtil',
+    'CPowU', 'CPowL', 'CCmd',
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _static_colors(term: Terminal) -> Dict[str, str]:
+    """Colors for GPUStat.print_to() that do not depend on the GPU status.
+
+    Evaluating terminal capabilities is not free, so they are computed once
+    per Terminal rather than for every GPU on every print.
+    """
+    return {
+        'C0': term.normal,
+        'C1': term.cyan,
+        'CMemP': term.yellow,
+        'CCPUMemU': term.yellow,
+        'CUser': term.bold_black,   # gray
+        'CCPUUtil': term.green,
+        'CPowL': term.magenta,
+        'CCmd': term.color(24),   # a bit dark
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _get_terminal(kind: Optional[str] = None,
+                  force_styling: Optional[bool] = False,
+                  stream=None) -> Terminal:
+    """Get a Terminal, which is reused across calls (e.g. every frame in
+    watch mode) for the same kind, styling and output stream."""
+    term = Terminal(kind=kind, force_styling=force_styling,  # type: ignore
+                    stream=stream)
+    if force_styling:
+        # workaround of issue #32 (watch doesn't recognize sgr0 characters)
+        # pylint: disable-next=protected-access
+        term._normal = '\x1b[0;10m'  # type: ignore
+    return term
+
+
+def _repr(v, none_value: Any = '??'):
+    return none_value if v is None else v
+
+
+def _process_repr(p: ProcessInfo, colors: Dict[str, str], *,
+                  show_cmd=False, show_user=False, show_pid=False) -> str:
+    """The short representation of a process, e.g. user:python/1234(100M)"""
+    C0 = colors['C0']
+    r = ''
+    if not show_cmd or show_user:
+        r += f"{colors['CUser']}{_repr(p['username'], '--')}{C0}"
+    if show_cmd:
+        if r:
+            r += ':'
+        r += f"{colors['C1']}{_repr(p.get('command', p['pid']), '--')}{C0}"
+
+    if show_pid:
+        r += f"/{_repr(p['pid'], '--')}"
+    r += f"({colors['CMemP']}{_repr(p['gpu_memory_usage'], '?')}M{C0})"
+    return r
+
+
+def _full_process_repr(p: ProcessInfo, colors: Dict[str, str]) -> str:
+    """The full process information: pid, cpu/memory usage and command."""
+    C0, CCmd = colors['C0'], colors['CCmd']
+    r = f"{C0} ├─ {_repr(p['pid'], '--'):>6} "
+    r += (f"{C0}({colors['CCPUUtil']}{_repr(p['cpu_percent'], '--'):4.0f}%{C0}, "
+          f"{colors['CCPUMemU']}{util.bytes2human(_repr(p['cpu_memory_usage'], 0)):>6}{C0})")
+    full_command_pretty = util.prettify_commandline(
+        p['full_command'], colors['C1'], CCmd)
+    r += f"{C0}: {CCmd}{_repr(full_command_pretty, '?')}{C0}"
+    return r
+
+
 class GPUStat:
 
+    __slots__ = ('entry',)
+
     def __init__(self, entry: NvidiaGPUInfo):
         if not isinstance(entry, dict):
             raise TypeError(
@@ -215,85 +313,70 @@ class GPUStat:
                  term=None,
                  ):
         if term is None:
-            term = Terminal(stream=sys.stdout)
+            # the current sys.stdout, which may have been redirected
+            term = _get_terminal(stream=sys.stdout)
+
+        # Values can be None if not available (e.g. not supported)
+        temperature, fan_speed = self.temperature, self.fan_speed
+        utilization = self.utilization
+        utilization_enc = self.utilization_enc
+        utilization_dec = self.utilization_dec
+        power_draw, power_limit = self.power_draw, self.power_limit
+        memory_used = self.entry['memory.used']
+        memory_total = self.entry['memory.total']
 
         # color settings
-        colors = {}
-
-        def _conditional(cond_fn, true_value, false_value,
-                         error_value=term.bold_black):
-            try:
-                return cond_fn() and true_value or false_value
-            except Exception:  # pylint: disable=broad-exception-caught
-                return error_value
-
-        _ENC_THRESHOLD = 50
-
-        colors['C0'] = term.normal
-        colors['C1'] = term.cyan
-        colors['CName'] = _conditional(lambda: self.available, term.blue, term.red)
-        colors['CTemp'] = _conditional(lambda: self.temperature < 50, term.red, term.bold_red)
-        colors['FSpeed'] = _conditional(lambda: self.fan_speed < 30, term.cyan, term.bold_cyan)
-        colors['CMemU'] = _conditional(lambda: self.available, term.bold_yellow, term.bold_black)
-        colors['CMemT'] = _conditional(lambda: self.available, term.yellow, term.bold_black)
-        colors['CMemP'] = term.yellow
-        colors['CCPUMemU'] = term.yellow
-        colors['CUser'] = term.bold_black   # gray
-        colors['CUtil'] = _conditional(lambda: self.utilization < 30, term.green, term.bold_green)
-        colors['CUtilEnc'] = _conditional(
-            lambda: self.utilization_enc < _ENC_THRESHOLD,
-            term.green, term.bold_green)
-        colors['CUtilDec'] = _conditional(
-            lambda: self.utilization_dec < _ENC_THRESHOLD,
-            term.green, term.bold_green)
-        colors['CCPUUtil'] = term.green
-        colors['CPowU'] = _conditional(
-            lambda: (self.power_limit is not None and
-                     float(self.power_draw) / self.power_limit < 0.4),  # type: ignore
-            term.magenta, term.bold_magenta
-        )
-        colors['CPowL'] = term.magenta
-        colors['CCmd'] = term.color(24)   # a bit dark
-
-        if not with_colors:
-            for k in list(colors.keys()):
-                colors[k] = ''
-
-        def _repr(v, none_value: Any = '??'):
-            return none_value if v is None else v
+        if with_colors:
+            colors = dict(_static_colors(term))
+
+            # Values that are not available (None) are displayed in gray.
+            _ENC_THRESHOLD = 50
+            if self.available:
+                colors['CName'] = term.blue
+                colors['CMemU'] = term.bold_yellow
+                colors['CMemT'] = term.yellow
+            else:
+                colors['CName'] = term.red
+                colors['CMemU'] = colors['CMemT'] = term.bold_black
+            colors['CTemp'] = (
+                term.bold_black if temperature is None else
+                term.red if temperature < 50 else term.bold_red)
+            colors['FSpeed'] = (
+                term.bold_black if fan_speed is None else
+                term.cyan if fan_speed < 30 else term.bold_cyan)
+            colors['CUtil'] = (
+                term.bold_black if utilization is None else
+                term.green if utilization < 30 else term.bold_green)
+            colors['CUtilEnc'] = (
+                term.bold_black if utilization_enc is None else
+                term.green if utilization_enc < _ENC_THRESHOLD else term.bold_green)
+            colors['CUtilDec'] = (
+                term.bold_black if utilization_dec is None else
+                term.green if utilization_dec < _ENC_THRESHOLD else term.bold_green)
+            if power_limit is None:
+                colors['CPowU'] = term.bold_magenta
+            elif power_draw is None or power_limit == 0:
+                colors['CPowU'] = term.bold_black
+            else:
+                colors['CPowU'] = (term.magenta if power_draw / power_limit < 0.4
+                                   else term.bold_magenta)
+        else:
+            colors = dict.fromkeys(_COLOR_NAMES, '')
 
         # build one-line display information
         # we want power use optional, but if deserves being grouped with
         # temperature and utilization
 
-        reps = []
+        write = fp.write
         def _write(*args, color=None, end=''):
-            args = [str(x) for x in args]
             if color:
-                # pylint: disable-next=consider-using-get
-                if color in colors:
-                    color = colors[color]
-                args = [color] + args + [term.normal]
+                write(colors.get(color, color))
+            for x in args:
+                write(str(x))
+            if color:
+                write(term.normal)
             if end:
-                args.append(end)
-            reps.extend(args)
-
-        def rjustify(x, size):
-            return f"{x:>{size}}"
-
-        # Null-safe property accessor like self.xxxx,
-        # but fall backs to '?' for None or missing values
-        class SafePropertyAccessor:
-            def __init__(self, obj):
-                self.obj = obj
-            def __getattr__(self, name):  # type: ignore
-                try:
-                    v = getattr(self.obj, name)
-                    return v if v is not None else '??'
-                except TypeError:  # possibly int(None), etc.
-                    return '??'
-
-        safe_self = cast(GPUStat, SafePropertyAccessor(self))
+                write(end)
 
         _write(f"[{self.index}]", color=term.cyan)
         _write(" ")
@@ -304,79 +387,43 @@ class GPUStat:
                    color='CName')
             _write(" |")
 
-        _write(rjustify(safe_self.temperature, 3), "°C", color='CTemp', end=', ')
+        _write(str(_repr(temperature)).rjust(3), "°C", color='CTemp', end=', ')
 
         if show_fan_speed:
-            _write(rjustify(safe_self.fan_speed, 3), " %", color='FSpeed', end=', ')
+            _write(str(_repr(fan_speed)).rjust(3), " %", color='FSpeed', end=', ')
 
-        _write(rjustify(safe_self.utilization, 3), " %", color='CUtil')
+        _write(str(_repr(utilization)).rjust(3), " %", color='CUtil')
 
         if show_codec:
             _write(" (")
             _sep = ''
             if "enc" in show_codec:
                 _write("E: ", color=term.bold)
-                _write(rjustify(safe_self.utilization_enc, 3), " %", color='CUtilEnc')
+                _write(str(_repr(utilization_enc)).rjust(3), " %", color='CUtilEnc')
                 _sep = '  '  # TODO comma?
             if "dec" in show_codec:
                 _write(_sep, "D: ", color=term.bold)
-                _write(rjustify(safe_self.utilization_dec, 3), " %", color='CUtilDec')
+                _write(str(_repr(utilization_dec)).rjust(3), " %", color='CUtilDec')
             _write(")")
 
         if show_power:
             _write(",  ")
-            _write(rjustify(safe_self.power_draw, 3), color='CPowU')
+            _write(str(_repr(power_draw)).rjust(3), color='CPowU')
             if show_power is True or 'limit' in show_power:
                 _write(" / ")
-                _write(rjustify(safe_self.power_limit, 3), ' W', color='CPowL')
+                _write(str(_repr(power_limit)).rjust(3), ' W', color='CPowL')
 
         # Memory
         _write(" | ")
-        _write(rjustify(safe_self.memory_used, 5), color='CMemU')
+        _write(str(_repr(memory_used)).rjust(5), color='CMemU')
         _write(" / ")
-        _write(rjustify(safe_self.memory_total, 5), color='CMemT')
+        _write(str(_repr(memory_total)).rjust(5), color='CMemT')
         _write(" MB")
 
         # Add " |" only if processes information is to be added.
         if not no_processes:
             _write(" |")
 
-        def process_repr(p: ProcessInfo):
-            r = ''
-            if not show_cmd or show_user:
-                r += "{CUser}{}{C0}".format(
-                    _repr(p['username'], '--'), **colors
-                )
-            if show_cmd:
-                if r:
-                    r += ':'
-                r += "{C1}{}{C0}".format(
-                    _repr(p.get('command', p['pid']), '--'), **colors
-                )
-
-            if show_pid:
-                r += ("/%s" % _repr(p['pid'], '--'))
-            r += '({CMemP}{}M{C0})'.format(
-                _repr(p['gpu_memory_usage'], '?'), **colors
-            )
-            return r
-
-        def full_process_info(p: ProcessInfo):
-            r = "{C0} ├─ {:>6} ".format(
-                    _repr(p['pid'], '--'), **colors
-                )
-            r += "{C0}({CCPUUtil}{:4.0f}%{C0}, {CCPUMemU}{:>6}{C0})".format(
-                    _repr(p['cpu_percent'], '--'),
-                    util.bytes2human(_repr(p['cpu_memory_usage'], 0)), **colors
-                )  # type: ignore
-            full_command_pretty = util.prettify_commandline(
-                p['full_command'], colors['C1'], colors['CCmd'])
-            r += "{C0}: {CCmd}{}{C0}".format(
-                _repr(full_command_pretty, '?'),
-                **colors
-            )
-            return r
-
         processes = self.entry['processes']
         full_processes = []
         if processes is None and not no_processes:
@@ -384,25 +431,27 @@ class GPUStat:
             _write(' ', '(', NOT_SUPPORTED, ')')
         elif not no_processes:
             for p in (processes or []):
-                _write(' ', process_repr(p))
+                _write(' ', _process_repr(p, colors, show_cmd=show_cmd,
+                                          show_user=show_user,
+                                          show_pid=show_pid))
                 if show_full_cmd:
-                    full_processes.append(eol_char + full_process_info(p))
+                    full_processes.append(eol_char + _full_process_repr(p, colors))
         if show_full_cmd and full_processes:
             full_processes[-1] = full_processes[-1].replace('├', '└', 1)
             _write(''.join(full_processes))
 
-        fp.write(''.join(reps))
         return fp
 
     def jsonify(self):
-        o = self.entry.copy()
-        if self.entry['processes'] is not None:
-            o['processes'] = [{k: v for (k, v) in p.items() if k != 'gpu_uuid'}
-                              for p in self.entry['processes']]
-        return o
+        # Process entries (see get_process_info) have no keys to filter out,
+        # e.g. 'gpu_uuid', so they are passed through without copying.
+        return self.entry.copy()
 
 
 class InvalidGPU(GPUStat):
+
+    __slots__ = ('exception',)
+
     class FallbackDict(dict):
         # pylint: disable-next=useless-return
         def __missing__(self, key):
@@ -422,143 +471,240 @@ class InvalidGPU(GPUStat):
         return False
 
 
+_HEADER_TEMPLATE = ('{t.bold_white}{hostname:{width}}{t.normal}  '
+                    '{timestr}  '
+                    '{t.bold_black}{driver_version}{t.normal}')
+
+
+def _decode(b: Union[str, bytes]) -> str:
+    if isinstance(b, bytes):
+        return b.decode('utf-8')
+    assert isinstance(b, str)
+    return b
+
+
+def _safepcall(fn: Callable[[], Any], error_value: Any):
+    # Ignore the exception from psutil when the process is gone
+    # at the moment of querying. See #144.
+    return util.safecall(
+        fn, error_value=error_value,
+        exc_types=(psutil.AccessDenied, psutil.NoSuchProcess,
+                   FileNotFoundError))
+
+
+def _get_ps_process_info(ps_process: psutil.Process) -> ProcessInfo:
+    """Get the information of a process that psutil provides"""
+    process = {}
+    username = GPUStatCollection.global_usernames.get(ps_process.pid)
+    attrs = ['cmdline', 'cpu_percent', 'memory_info']
+    if username is None:
+        attrs.append('username')
+
+    # as_dict() reads all the attributes at once (within oneshot());
+    # attributes that can't be accessed (AccessDenied) are None.
+    info = _safepcall(lambda: ps_process.as_dict(attrs=attrs), {})
+
+    if username is None:
+        username = info.get('username')
+        if username is not None:
+            GPUStatCollection.global_usernames[ps_process.pid] = username
+    process['username'] = '?' if username is None else username
+    # cmdline returns full path;
+    # as in `ps -o comm`, get short cmdnames.
+    _cmdline = info.get('cmdline')
+    if not _cmdline:
+        # sometimes, zombie or unknown (e.g. [kworker/8:2H])
+        process['command'] = '?'
+        process['full_command'] = ['?']
+    else:
+        process['command'] = os.path.basename(_cmdline[0])
+        process['full_command'] = _cmdline
+
+    process['cpu_percent'] = info.get('cpu_percent') or 0.0
+    # the resident set size, in Bytes
+    memory_info = info.get('memory_info')
+    process['cpu_memory_usage'] = \
+        memory_info.rss if memory_info is not None else 0.0
+    return process
+
+
 class GPUStatCollection(Sequence[GPUStat]):
 
+    __slots__ = ('gpus', 'hostname', 'query_time', 'driver_version')
+
     global_processes = {}
 
+    # NVML device handles by index; they remain valid as long as NVML is
+    # initialized (see gpustat.nvml), so there is no need to query them again.
+    global_handles: Dict[int, NVMLHandle] = {}
+
+    # (name, uuid) of GPUs by index, which never change for a device.
+    global_static_info: Dict[int, Tuple[str, str]] = {}
+
+    # NVML functions that are not supported by GPUs (by index). Such a query
+    # would fail every time with an exception, so it is skipped afterwards.
+    global_unsupported: Dict[int, Set[str]] = {}
+
+    # The version of the NVIDIA driver, which can't change without reloading
+    # the driver (and NVML) anyway.
+    global_driver_version: Optional[str] = None
+
+    # Owner of the processes by pid. Resolving the username takes a passwd
+    # (or NSS) lookup each time, so do it only once for a process.
+    global_usernames: Dict[int, str] = {}
+
     def __init__(self,
                  gpu_list: Sequence[GPUStat],
                  driver_version: Optional[str] = None):
         self.gpus = list(gpu_list)
 
         # attach additional system information
-        self.hostname = platform.node()
+        self.hostname = _HOSTNAME
         self.query_time = datetime.now()
         self.driver_version = driver_version
 
     @staticmethod
     def clean_processes():
-        for pid in list(GPUStatCollection.global_processes.keys()):
-            if not psutil.pid_exists(pid):
-                del GPUStatCollection.global_processes[pid]
+        # is_running() is False also when the pid has been reused by
+        # another process, whose owner can be different.
+        processes = GPUStatCollection.global_processes
+        for pid, ps_process in list(processes.items()):
+            if not ps_process.is_running():
+                del processes[pid]
+                GPUStatCollection.global_usernames.pop(pid, None)
+
+    @staticmethod
+    def get_handle(index: int) -> NVMLHandle:
+        """Get the (cached) NVML handle of the GPU at the given index."""
+        handle = GPUStatCollection.global_handles.get(index)
+        if handle is None:
+            handle = N.nvmlDeviceGetHandleByIndex(index)
+            GPUStatCollection.global_handles[index] = handle
+        return handle
 
     @staticmethod
-    def new_query(debug=False, id=None) -> 'GPUStatCollection':
-        """Query the information of all the GPUs on local machine"""
+    def new_query(debug=False, id=None,
+                  no_processes=False) -> 'GPUStatCollection':
+        """Query the information of all the GPUs on local machine.
+
+        If no_processes is True, running processes are not queried at all
+        and the 'processes' of every GPU will be None.
+        """
 
         nvml.ensure_initialized()
         log = util.DebugHelper()
 
-        def _decode(b: Union[str, bytes]) -> str:
-            if isinstance(b, bytes):
-                return b.decode('utf-8')
-            assert isinstance(b, str)
-            return b
+        # per-query cache of process information, keyed by pid
+        ps_process_infos: Dict[int, ProcessInfo] = {}
 
-        def get_gpu_info(handle: NVMLHandle) -> NvidiaGPUInfo:
-            """Get one GPU information specified by nvml handle"""
+        # pids of the processes that are seen for the first time
+        new_pids: Set[int] = set()
 
-            def safepcall(fn: Callable[[], Any], error_value: Any):
-                # Ignore the exception from psutil when the process is gone
-                # at the moment of querying. See #144.
-                return util.safecall(
-                    fn, error_value=error_value,
-                    exc_types=(psutil.AccessDenied, psutil.NoSuchProcess,
-                               FileNotFoundError))
+        # guards global_processes, ps_process_infos and new_pids
+        process_lock = threading.Lock()
+
+        def get_gpu_info(index: int, handle: NVMLHandle) -> NvidiaGPUInfo:
+            """Get one GPU information specified by nvml handle"""
 
             def get_process_info(nv_process) -> ProcessInfo:
                 """Get the process information of specific pid"""
-                process = {}
-                if nv_process.pid not in GPUStatCollection.global_processes:
-                    GPUStatCollection.global_processes[nv_process.pid] = \
-                        psutil.Process(pid=nv_process.pid)
-                ps_process: psutil.Process = GPUStatCollection.global_processes[nv_process.pid]
-
-                # TODO: ps_process is being cached, but the dict below is not.
-                process['username'] = safepcall(ps_process.username, '?')
-                # cmdline returns full path;
-                # as in `ps -o comm`, get short cmdnames.
-                _cmdline = safepcall(ps_process.cmdline, [])
-                if not _cmdline:
-                    # sometimes, zombie or unknown (e.g. [kworker/8:2H])
-                    process['command'] = '?'
-                    process['full_command'] = ['?']
-                else:
-                    process['command'] = os.path.basename(_cmdline[0])
-                    process['full_command'] = _cmdline
+                pid = nv_process.pid
+                # GPUs are queried on multiple threads, and a process can run
+                # on multiple GPUs: create one psutil.Process per pid and
+                # query psutil only once for it.
+                with process_lock:
+                    ps_process = GPUStatCollection.global_processes.get(pid)
+                    if ps_process is None or not ps_process.is_running():
+                        # a new process, or the pid has been reused since
+                        GPUStatCollection.global_usernames.pop(pid, None)
+                        ps_process = psutil.Process(pid=pid)
+                        GPUStatCollection.global_processes[pid] = ps_process
+                        new_pids.add(pid)
+
+                    if pid not in ps_process_infos:
+                        ps_process_infos[pid] = _get_ps_process_info(ps_process)
+                    process = dict(ps_process_infos[pid])
+
                 # Bytes to MBytes
                 # if drivers are not TTC this will be None.
                 usedmem = nv_process.usedGpuMemory // MB if \
                           nv_process.usedGpuMemory else None
                 process['gpu_memory_usage'] = usedmem
 
-                process['cpu_percent'] = safepcall(ps_process.cpu_percent, 0.0)
-                process['cpu_memory_usage'] = safepcall(
-                    lambda: round((ps_process.memory_percent() / 100.0) *
-                                  psutil.virtual_memory().total),
-                    0.0)
-
-                process['pid'] = nv_process.pid
+                process['pid'] = pid
                 return process
 
-            def safenvml(fn):
-                @functools.wraps(fn)
-                def _wrapped(*args, **kwargs):
-                    try:
-                        return fn(*args, **kwargs)
-                    except N.NVMLError as e:
-                        log.add_exception(fn.__name__, e)
-                        return None  # Not supported
-                return _wrapped
+            def safenvml(fn, *args):
+                """Call fn(*args), or return None if it fails."""
+                if fn.__name__ in unsupported:
+                    return None  # Not supported, known from earlier queries
+                try:
+                    return fn(*args)
+                except N.NVMLError_NotSupported as e:
+                    unsupported.add(fn.__name__)
+                    log.add_exception(fn.__name__, e)
+                    return None  # Not supported
+                except N.NVMLError as e:
+                    log.add_exception(fn.__name__, e)
+                    return None  # Not supported
 
             gpu_info = NvidiaGPUInfo()
-            gpu_info['index'] = N.nvmlDeviceGetIndex(handle)
+            # the handle was obtained by index, so no need to ask NVML again
+            gpu_info['index'] = index
+            unsupported = GPUStatCollection.global_unsupported.setdefault(index, set())
 
-            gpu_info['name'] = _decode(N.nvmlDeviceGetName(handle))
-            gpu_info['uuid'] = _decode(N.nvmlDeviceGetUUID(handle))
+            static_info = GPUStatCollection.global_static_info.get(index)
+            if static_info is None:
+                static_info = (_decode(N.nvmlDeviceGetName(handle)),
+                               _decode(N.nvmlDeviceGetUUID(handle)))
+                GPUStatCollection.global_static_info[index] = static_info
+            gpu_info['name'], gpu_info['uuid'] = static_info
 
             gpu_info['temperature.gpu'] = safenvml(
-                N.nvmlDeviceGetTemperature)(handle, N.NVML_TEMPERATURE_GPU)
+                N.nvmlDeviceGetTemperature, handle, N.NVML_TEMPERATURE_GPU)
 
-            gpu_info['fan.speed'] = safenvml(N.nvmlDeviceGetFanSpeed)(handle)
+            gpu_info['fan.speed'] = safenvml(N.nvmlDeviceGetFanSpeed, handle)
 
             # memory: in Bytes
             # Note that this is a compat-patched API (see gpustat.nvml)
             memory = N.nvmlDeviceGetMemoryInfo(handle)
-            gpu_info['memory.used'] = int(memory.used) // MB
-            gpu_info['memory.total'] = int(memory.total) // MB
+            gpu_info['memory.used'] = memory.used // MB  # Bytes to MBytes
+            gpu_info['memory.total'] = memory.total // MB
 
             # GPU utilization
-            utilization = safenvml(N.nvmlDeviceGetUtilizationRates)(handle)
-            gpu_info['utilization.gpu'] = int(utilization.gpu) if utilization is not None else None
+            utilization = safenvml(N.nvmlDeviceGetUtilizationRates, handle)
+            gpu_info['utilization.gpu'] = utilization.gpu if utilization is not None else None
 
-            utilization = safenvml(N.nvmlDeviceGetEncoderUtilization)(handle)
+            utilization = safenvml(N.nvmlDeviceGetEncoderUtilization, handle)
             gpu_info['utilization.enc'] = utilization[0] if utilization is not None else None
 
-            utilization = safenvml(N.nvmlDeviceGetDecoderUtilization)(handle)
+            utilization = safenvml(N.nvmlDeviceGetDecoderUtilization, handle)
             gpu_info['utilization.dec'] = utilization[0] if utilization is not None else None
 
             # Power
-            power = safenvml(N.nvmlDeviceGetPowerUsage)(handle)
+            power = safenvml(N.nvmlDeviceGetPowerUsage, handle)
             gpu_info['power.draw'] = power // 1000 if power is not None else None
 
-            power_limit = safenvml(N.nvmlDeviceGetEnforcedPowerLimit)(handle)
+            power_limit = safenvml(N.nvmlDeviceGetEnforcedPowerLimit, handle)
             gpu_info['enforced.power.limit'] = power_limit // 1000 if power_limit is not None else None
 
             # Processes
-            nv_comp_processes = safenvml(N.nvmlDeviceGetComputeRunningProcesses)(handle)
-            nv_graphics_processes = safenvml(N.nvmlDeviceGetGraphicsRunningProcesses)(handle)
+            if no_processes:
+                gpu_info['processes'] = None
+                return gpu_info
+
+            nv_comp_processes = safenvml(N.nvmlDeviceGetComputeRunningProcesses, handle)
+            nv_graphics_processes = safenvml(N.nvmlDeviceGetGraphicsRunningProcesses, handle)
 
             if nv_comp_processes is None and nv_graphics_processes is None:
                 processes = None
             else:
                 processes = []
-                nv_comp_processes = nv_comp_processes or []
-                nv_graphics_processes = nv_graphics_processes or []
                 # A single process might run in both of graphics and compute mode,
                 # However we will display the process only once
                 seen_pids = set()
-                for nv_process in nv_comp_processes + nv_graphics_processes:
+                for nv_process in itertools.chain(nv_comp_processes or (),
+                                                  nv_graphics_processes or ()):
                     if nv_process.pid in seen_pids:
                         continue
                     seen_pids.add(nv_process.pid)
@@ -578,20 +724,26 @@ class GPUStatCollection(Sequence[GPUStat]):
                         # there appears to be a bug of psutil. It is unlikely
                         # FileNotFoundError is thrown in different situations.
                         pass
-
-                # TODO: Do not block if full process info is not requested
-                time.sleep(0.1)
-                for process in processes:
-                    pid = process['pid']
-                    cache_process: psutil.Process = GPUStatCollection.global_processes[pid]
-                    process['cpu_percent'] = safepcall(cache_process.cpu_percent, 0)
             gpu_info['processes'] = processes
 
-            GPUStatCollection.clean_processes()
             return gpu_info
 
+        def query_gpu(index: int) -> GPUStat:
+            """Get one GPUStat (or InvalidGPU) for the given GPU index"""
+            try:
+                handle: NVMLHandle = GPUStatCollection.get_handle(index)
+                gpu_info = get_gpu_info(index, handle)
+                gpu_stat = GPUStat(gpu_info)
+            except N.NVMLError_Unknown as e:
+                gpu_stat = InvalidGPU(index, "((Unknown Error))", e)
+            except N.NVMLError_GpuIsLost as e:
+                gpu_stat = InvalidGPU(index, "((GPU is lost))", e)
+
+            if isinstance(gpu_stat, InvalidGPU):
+                log.add_exception("GPU %d" % index, gpu_stat.exception)
+            return gpu_stat
+
         # 1. get the list of gpu and status
-        gpu_list = []
         device_count = N.nvmlDeviceGetCount()
 
         if id is None:
@@ -603,28 +755,43 @@ class GPUStatCollection(Sequence[GPUStat]):
         else:
             raise TypeError(f"Unknown id: {id}")
 
-        for index in gpus_to_query:
+        if len(gpus_to_query) > 1:
+            # NVML calls release the GIL, so GPUs can be queried in parallel.
+            max_workers = min(len(gpus_to_query), MAX_QUERY_THREADS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                gpu_list = list(executor.map(query_gpu, gpus_to_query))
+        else:
+            gpu_list = [query_gpu(index) for index in gpus_to_query]
+
+        # cpu_percent is measured by psutil since the previous call for the
+        # same process, so it is not available yet (0.0) for new processes.
+        # Measure them over a short period of time, but only once per query;
+        # known processes (e.g. in watch mode) need no waiting at all.
+        # TODO: Do not block if full process info is not requested
+        if new_pids:
+            time.sleep(0.1)
+            cpu_percents = {
+                pid: _safepcall(GPUStatCollection.global_processes[pid].cpu_percent, 0)
+                for pid in new_pids
+            }
+            for gpu_stat in gpu_list:
+                for process in (gpu_stat.processes or []):
+                    if process['pid'] in cpu_percents:
+                        process['cpu_percent'] = cpu_percents[process['pid']]
+
+        # global_processes should not be modified while GPUs are being queried
+        GPUStatCollection.clean_processes()
+
+        # 2. additional info (driver version, etc), checked only once.
+        driver_version = GPUStatCollection.global_driver_version
+        if driver_version is None:
             try:
-                handle: NVMLHandle = N.nvmlDeviceGetHandleByIndex(index)
-                gpu_info = get_gpu_info(handle)
-                gpu_stat = GPUStat(gpu_info)
-            except N.NVMLError_Unknown as e:
-                gpu_stat = InvalidGPU(index, "((Unknown Error))", e)
-            except N.NVMLError_GpuIsLost as e:
-                gpu_stat = InvalidGPU(index, "((GPU is lost))", e)
-
-            if isinstance(gpu_stat, InvalidGPU):
-                log.add_exception("GPU %d" % index, gpu_stat.exception)
-            gpu_list.append(gpu_stat)
-
-        # 2. additional info (driver version, etc).
-        # TODO: check this only once, no need to call multiple times
-        try:
-            driver_version = _decode(N.nvmlSystemGetDriverVersion())
-            check_driver_nvml_version(driver_version)
-        except N.NVMLError as e:
-            log.add_exception("driver_version", e)
-            driver_version = None    # N/A
+                driver_version = _decode(N.nvmlSystemGetDriverVersion())
+                check_driver_nvml_version(driver_version)
+            except N.NVMLError as e:
+                log.add_exception("driver_version", e)
+                driver_version = None    # N/A
+            GPUStatCollection.global_driver_version = driver_version
 
         if debug:
             log.report_summary()
@@ -664,34 +831,24 @@ class GPUStatCollection(Sequence[GPUStat]):
 
         if force_color:
             TERM = os.getenv('TERM') or 'xterm-256color'
-            t_color = Terminal(kind=TERM, force_styling=True)
-
-            # workaround of issue #32 (watch doesn't recognize sgr0 characters)
-            # pylint: disable-next=protected-access
-            t_color._normal = '\x1b[0;10m'  # type: ignore
+            t_color = _get_terminal(kind=TERM, force_styling=True)
         elif no_color:
-            t_color = Terminal(force_styling=None)  # type: ignore
+            t_color = _get_terminal(force_styling=None)
         else:
-            t_color = Terminal()   # auto, depending on isatty
+            t_color = _get_terminal()   # auto, depending on isatty
 
         # appearance settings
         if gpuname_width is None:
-            gpuname_width = max([len(g.entry['name']) for g in self] + [0])
+            gpuname_width = max((len(g.entry['name']) for g in self), default=0)
+
+        # Render the whole frame into a buffer first and write it at once,
+        # rather than issuing many small writes to fp (e.g. a slow terminal).
+        buf = StringIO()
 
         # header
         if show_header:
-            if IS_WINDOWS:
-                # no localization is available; just use a reasonable default
-                # same as str(timestr) but without ms
-                timestr = self.query_time.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                time_format = locale.nl_langinfo(locale.D_T_FMT)
-                timestr = self.query_time.strftime(time_format)
-            header_template = '{t.bold_white}{hostname:{width}}{t.normal}  '
-            header_template += '{timestr}  '
-            header_template += '{t.bold_black}{driver_version}{t.normal}'
-
-            header_msg = header_template.format(
+            timestr = self.query_time.strftime(_time_format())
+            header_msg = _HEADER_TEMPLATE.format(
                     hostname=self.hostname,
                     width=(gpuname_width or DEFAULT_GPUNAME_WIDTH) + 3,  # len("[?]")
                     timestr=timestr,
@@ -699,12 +856,12 @@ class GPUStatCollection(Sequence[GPUStat]):
                     t=t_color,
                 )
 
-            fp.write(header_msg.strip())
-            fp.write(eol_char)
+            buf.write(header_msg.strip())
+            buf.write(eol_char)
 
         # body
         for g in self:
-            g.print_to(fp,
+            g.print_to(buf,
                        show_cmd=show_cmd,
                        show_full_cmd=show_full_cmd,
                        no_processes=no_processes,
@@ -716,11 +873,13 @@ class GPUStatCollection(Sequence[GPUStat]):
                        gpuname_width=gpuname_width,
                        eol_char=eol_char,
                        term=t_color)
-            fp.write(eol_char)
+            buf.write(eol_char)
 
         if len(self.gpus) == 0:
-            print(t_color.yellow("(No GPUs are available)"))
+            buf.write(t_color.yellow("(No GPUs are available)"))
+            buf.write(eol_char)
 
+        fp.write(buf.getvalue())
         fp.flush()
 
     def jsonify(self):
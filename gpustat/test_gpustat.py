@@ -10,6 +10,7 @@ import os
 import re
 import shlex
 import sys
+import time
 import types
 from collections import namedtuple
 from io import StringIO
@@ -17,7 +18,7 @@ from typing import Any
 
 import psutil
 import pytest
-from mockito import ANY, mock, unstub, when, when2
+from mockito import ANY, mock, unstub, verify, when, when2
 
 import gpustat
 from gpustat.nvml import pynvml, pynvml_monkeypatch
@@ -49,6 +50,12 @@ def _configure_mock(N=pynvml,
 
     when(N).nvmlInit().thenReturn()
     gpustat.nvml._initialized = True  # nvmlInit() is called upon module import
+    gpustat.core.GPUStatCollection.global_driver_version = None
+    gpustat.core.GPUStatCollection.global_handles.clear()
+    gpustat.core.GPUStatCollection.global_processes.clear()
+    gpustat.core.GPUStatCollection.global_static_info.clear()
+    gpustat.core.GPUStatCollection.global_usernames.clear()
+    gpustat.core.GPUStatCollection.global_unsupported.clear()
     when(N).nvmlShutdown().thenReturn()
     when(N).nvmlSystemGetDriverVersion().thenReturn('415.27.mock')
 
@@ -176,6 +183,8 @@ def _configure_mock(N=pynvml,
     assert 99999 not in mock_pid_map, 'scenario_nonexistent_pid'
     assert 99995 not in mock_pid_map, 'scenario_nonexistent_pid (#95)'
 
+    mock_pmem_t = namedtuple("pmem", ['rss'])  # psutil.Process.memory_info
+
     def _MockedProcess(pid):
         if pid not in mock_pid_map:
             if pid == 99995:
@@ -190,14 +199,15 @@ def _configure_mock(N=pynvml,
         p.username = lambda: username
         p.cmdline = lambda: [cmdline]
         p.cpu_percent = lambda: cpuutil
-        p.memory_percent = lambda: memutil
+        p.memory_info = lambda: mock_pmem_t(
+            rss=round(memutil / 100.0 * 8589934592))  # of 8GB total memory
+        p.as_dict = lambda attrs: {attr: getattr(p, attr)() for attr in attrs}
+        p.is_running = lambda: True
         p.pid = pid
         return p
 
     when(psutil).Process(...)\
         .thenAnswer(_MockedProcess)
-    when(psutil).virtual_memory()\
-        .thenReturn(mock_memory_t(total=8589934592, used=0))
 
 
 MOCK_EXPECTED_OUTPUT_DEFAULT = os.linesep.join("""\
@@ -598,6 +608,121 @@ class TestGPUStat(object):
         assert '[0] GeForce GTX TITAN 0' in lines[0]
         assert '[1] GeForce GTX TITAN 1' in lines[1]
 
+    def test_new_query_caches_devices(self, scenario_basic):
+        """NVML handles, static information of GPUs and the driver version
+        should be obtained only once across queries."""
+        gpustat.new_query()
+        gpustats = gpustat.new_query()
+
+        for i in range(3):
+            verify(pynvml, times=1).nvmlDeviceGetHandleByIndex(i)
+            verify(pynvml, times=1).nvmlDeviceGetName(mock_gpu_handles[i])
+            verify(pynvml, times=1).nvmlDeviceGetUUID(mock_gpu_handles[i])
+            verify(pynvml, times=0).nvmlDeviceGetIndex(mock_gpu_handles[i])
+        verify(pynvml, times=1).nvmlSystemGetDriverVersion()
+
+        assert gpustats[0].name == 'GeForce GTX TITAN 0'
+        assert gpustats[2].uuid == 'GPU-50205d95-57b6-f541-2bcb-86c09afed564'
+
+        # Not supported queries should not be tried again, but others should.
+        verify(pynvml, times=2).nvmlDeviceGetPowerUsage(mock_gpu_handles[0])
+        verify(pynvml, times=1).nvmlDeviceGetPowerUsage(mock_gpu_handles[1])
+        verify(pynvml, times=1).nvmlDeviceGetUtilizationRates(mock_gpu_handles[2])
+        assert gpustats[1].power_draw is None
+        assert gpustats[2].utilization is None
+
+    def test_new_query_cpu_percent_wait(self, scenario_basic, monkeypatch):
+        """Waiting for cpu_percent of processes is needed only once, for the
+        processes that have not been seen before."""
+        sleeps = []
+        monkeypatch.setattr(gpustat.core.time, 'sleep', sleeps.append)
+
+        gpustats = gpustat.new_query()
+        assert sleeps == [0.1]
+        assert gpustats[0].processes[0]['cpu_percent'] == 85.25
+
+        gpustats = gpustat.new_query()
+        assert sleeps == [0.1]
+        assert gpustats[0].processes[0]['cpu_percent'] == 85.25
+
+    def test_new_query_shared_pid(self, scenario_basic):
+        """A process running on multiple GPUs, which are queried in parallel,
+        should be looked up with one psutil.Process."""
+        mock_process_t = namedtuple("Process_t", ['pid', 'usedGpuMemory'])
+        for i in range(2):
+            when(pynvml).nvmlDeviceGetComputeRunningProcesses(mock_gpu_handles[i])\
+                .thenReturn([mock_process_t(48448, 4000*MB)])
+            when(pynvml).nvmlDeviceGetGraphicsRunningProcesses(mock_gpu_handles[i])\
+                .thenReturn([])
+
+        class _SlowProcess:
+            """Like psutil.Process, cpu_percent() is 0.0 on the first call."""
+            instances = []
+
+            def __init__(self, pid):
+                time.sleep(0.05)  # give other threads a chance to race
+                self.pid = pid
+                self.primed = False
+                _SlowProcess.instances.append(self)
+
+            def is_running(self):
+                return True
+
+            def cpu_percent(self):
+                percent, self.primed = (50.0 if self.primed else 0.0), True
+                return percent
+
+            def as_dict(self, attrs):
+                info = dict(username='user1', cmdline=['python'],
+                            memory_info=None)
+                return {attr: (self.cpu_percent() if attr == 'cpu_percent'
+                               else info[attr]) for attr in attrs}
+
+        when(psutil).Process(...).thenAnswer(_SlowProcess)
+
+        gpustats = gpustat.new_query()
+        assert len(_SlowProcess.instances) == 1
+        assert [g.processes[0]['cpu_percent'] for g in gpustats[:2]] == \
+            [50.0, 50.0]
+
+    def test_new_query_reused_pid(self, scenario_basic):
+        """When the pid of an exited process is reused by another process,
+        the username of the old process should not be shown for it."""
+        gpustats = gpustat.new_query()
+        assert gpustats[0].processes[0]['pid'] == 48448
+        assert gpustats[0].processes[0]['username'] == 'user1'
+
+        # the process has exited, and a process of user2 took over the pid
+        old_process = gpustat.GPUStatCollection.global_processes[48448]
+        old_process.is_running = lambda: False
+        info = dict(username='user2', cmdline=['bash'], cpu_percent=10.0,
+                    memory_info=None)
+        new_process: Any = mock(strict=True)   # psutil.Process
+        new_process.pid = 48448
+        new_process.is_running = lambda: True
+        new_process.cpu_percent = lambda: 10.0
+        new_process.as_dict = lambda attrs: {attr: info[attr] for attr in attrs}
+        when(psutil).Process(pid=48448).thenReturn(new_process)
+
+        gpustats = gpustat.new_query()
+        assert gpustats[0].processes[0]['username'] == 'user2'
+        assert gpustats[0].processes[0]['command'] == 'bash'
+        assert gpustat.GPUStatCollection.global_usernames[48448] == 'user2'
+
+    def test_new_query_no_processes(self, scenario_basic):
+        """Processes should not be queried at all with no_processes=True."""
+        gpustats = gpustat.GPUStatCollection.new_query(no_processes=True)
+
+        assert [g.processes for g in gpustats] == [None, None, None]
+        verify(pynvml, times=0).nvmlDeviceGetComputeRunningProcesses(...)
+        verify(pynvml, times=0).nvmlDeviceGetGraphicsRunningProcesses(...)
+        verify(psutil, times=0).Process(...)
+
+        fp = StringIO()
+        gpustats.print_formatted(fp=fp, show_header=False, no_processes=True)
+        assert remove_ansi_codes(fp.getvalue()).rstrip() == \
+            MOCK_EXPECTED_OUTPUT_NO_PROCESSES
+
     def test_attributes_and_items(self, scenario_basic):
         """Test whether each property of `GPUStat` instance is well-defined."""
 
@@ -732,6 +857,23 @@ class TestGPUStat(object):
         with pytest.raises(AssertionError):
             capture_output('gpustat', '--unrecognized-args-in-test')
 
+    def test_args_commandline_showall_precedence(self, scenario_basic):
+        """Options given after --show-all take precedence over it, but the
+        ones given before it are overridden."""
+        capture_output = self.capture_output
+
+        s = remove_ansi_codes(capture_output('gpustat', '-a', '-e', 'enc'))
+        assert '(E:  88 %)' in s
+        assert 'D:  67 %' not in s
+        assert 'user1:python/48448(4000M)' in s  # other options of -a
+
+        s = remove_ansi_codes(capture_output('gpustat', '-e', 'enc', '-a'))
+        assert '(E:  88 %  D:  67 %)' in s
+
+        s = remove_ansi_codes(capture_output('gpustat', '-a', '-P', ''))
+        assert ' W |' not in s
+        assert '(E:  88 %  D:  67 %)' in s
+
     @pytest.mark.skipif(sys.platform == 'win32', reason="Do not run on Windows")
     def test_no_TERM(self, scenario_basic, monkeypatch):
         """--color should work well even when executed without TERM,
@@ -760,6 +902,7 @@ class TestGPUStat(object):
 
         assert j['driver_version'] == '415.27.mock'
         assert j['hostname']
+        assert j['query_time'] == gpustats.query_time.isoformat()
         assert j['gpus']
 
 